@@ -507,3 +507,33 @@ Month Year – Month Year | Location
 - Company name is ALWAYS the last part after "|" separators
 """
 
+
+# ---------------------------------------------------------------------------
+# Precompiled prompt builders
+#
+# str.format re-parses these multi-KB templates on every call; parsing them
+# once at import time and joining the precomputed segments skips that work
+# on the request hot path.
+
+import string as _string
+
+
+def _compile_prompt(template: str):
+    segments = [
+        (literal, field)
+        for literal, field, _spec, _conv in _string.Formatter().parse(template)
+    ]
+
+    def build(**values) -> str:
+        parts = []
+        for literal, field in segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(str(values[field]))
+        return "".join(parts)
+
+    return build
+
+
+build_resume_prompt = _compile_prompt(ENHANCED_RESUME_PROMPT)
+build_cover_letter_prompt = _compile_prompt(ENHANCED_COVER_LETTER_PROMPT)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import atexit
 import contextlib
-import time
+import os
+import threading
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Iterable
@@ -21,18 +24,154 @@ class CandidateProfile:
     phone: str = ""
 
 
+def _existing_file(path_str: str | None) -> Path | None:
+    """Expand and stat a user-supplied path in one shot; None when absent."""
+    if not path_str:
+        return None
+    p = Path(path_str).expanduser()
+    try:
+        os.stat(p)
+    except OSError:
+        return None
+    return p
+
+
 def is_greenhouse_url(url: str | None) -> bool:
-    if not url:
-        return False
-    u = url.lower()
-    return "greenhouse.io" in u or "boards.greenhouse.io" in u
+    # "boards.greenhouse.io" is implied by "greenhouse.io"; one scan suffices.
+    return bool(url) and "greenhouse.io" in url.lower()
 
 
 def is_lever_url(url: str | None) -> bool:
-    if not url:
-        return False
-    u = url.lower()
-    return "jobs.lever.co" in u or "lever.co" in u
+    return bool(url) and "lever.co" in url.lower()
+
+
+class WebDriverPool:
+    """Parks warm WebDriver sessions for reuse across autofill runs.
+
+    Quitting the browser after every URL pays full startup (~2-5s) each
+    time; release() instead resets the session (cookies + about:blank) and
+    keeps it ready for the next acquire(). Idle sessions are keyed by the
+    factory that created them, so a caller only ever gets back browsers
+    configured the way its own factory asked for. Callers that build a
+    fresh factory closure per run would park sessions under a key nothing
+    can ever present again, so each factory is watched with
+    weakref.finalize and its bucket is quit when the factory is collected.
+    """
+
+    # Sessions released beyond this per factory are quit, not parked.
+    max_idle_per_key = 2
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[int, list[WebDriver]] = {}
+        self._driver_keys: dict[int, int] = {}
+        self._live_keys: set[int] = set()
+
+    def acquire(self, factory: Callable[[], WebDriver | None]) -> WebDriver | None:
+        key = id(factory)
+        with self._lock:
+            bucket = self._idle.get(key)
+            if bucket:
+                return bucket.pop()
+        driver = factory()
+        if driver is not None:
+            with self._lock:
+                self._driver_keys[id(driver)] = key
+                watch = key not in self._live_keys
+                if watch:
+                    self._live_keys.add(key)
+            if watch:
+                with contextlib.suppress(TypeError):
+                    weakref.finalize(factory, self._evict, key)
+        return driver
+
+    def release(self, driver: WebDriver) -> None:
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:
+            # Session is broken; don't recycle it.
+            self._discard(driver)
+            return
+        with self._lock:
+            key = self._driver_keys.get(id(driver))
+            if key is not None and key in self._live_keys:
+                bucket = self._idle.setdefault(key, [])
+                if len(bucket) < self.max_idle_per_key:
+                    bucket.append(driver)
+                    return
+        # Unknown provenance, a dead factory, or a full bucket: quit it.
+        self._discard(driver)
+
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._driver_keys.pop(id(driver), None)
+        with contextlib.suppress(WebDriverException):
+            driver.quit()
+
+    def _evict(self, key: int) -> None:
+        """Quit the sessions parked under a factory that no longer exists."""
+        with self._lock:
+            drivers = self._idle.pop(key, [])
+            self._live_keys.discard(key)
+            for driver in drivers:
+                self._driver_keys.pop(id(driver), None)
+        for driver in drivers:
+            with contextlib.suppress(WebDriverException):
+                driver.quit()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            buckets, self._idle = self._idle, {}
+            self._driver_keys.clear()
+            self._live_keys.clear()
+        for drivers in buckets.values():
+            for driver in drivers:
+                with contextlib.suppress(WebDriverException):
+                    driver.quit()
+
+
+_DRIVER_POOL = WebDriverPool()
+atexit.register(_DRIVER_POOL.shutdown)
+
+
+# Locates and fills every (selector, value) pair in one browser-side pass so
+# the whole form costs a single WebDriver round-trip instead of one per field.
+# The value goes through the native prototype setter: assigning el.value
+# directly updates React's internal value tracker, making the subsequent
+# input event look like a no-change that React ignores. A selector is only
+# reported as filled if the value actually stuck, so callers fall back to
+# real keystrokes for anything else.
+_BULK_FILL_JS = """
+const pairs = arguments[0];
+const filled = [];
+const setNative = (el, val) => {
+    const proto = el instanceof HTMLTextAreaElement
+        ? HTMLTextAreaElement.prototype
+        : HTMLInputElement.prototype;
+    const desc = Object.getOwnPropertyDescriptor(proto, 'value');
+    if (desc && desc.set) { desc.set.call(el, val); } else { el.value = val; }
+};
+for (const [sel, val] of pairs) {
+    const el = document.querySelector(sel);
+    if (!el) continue;
+    el.focus();
+    setNative(el, val);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    if (el.value === val) filled.push(sel);
+}
+return filled;
+"""
+
+# Fallback for apply buttons identified only by their text: one browser-side
+# scan beats an XPath translate() walk over the whole DOM.
+_APPLY_TEXT_JS = """
+const el = [...document.querySelectorAll('a, button')]
+    .find(e => /apply/i.test(e.textContent));
+if (el) { el.click(); return true; }
+return false;
+"""
 
 
 class _BaseSimpleAutofill:
@@ -42,6 +181,7 @@ class _BaseSimpleAutofill:
         self.wait_seconds = wait_seconds
         self.verbose = verbose
         self._driver: WebDriver | None = None
+        self._wait: WebDriverWait | None = None
 
     def __enter__(self) -> "_BaseSimpleAutofill":
         self._ensure_driver()
@@ -52,7 +192,9 @@ class _BaseSimpleAutofill:
 
     def _ensure_driver(self) -> WebDriver | None:
         if self._driver is None:
-            self._driver = self._driver_factory()
+            self._driver = _DRIVER_POOL.acquire(self._driver_factory)
+            if self._driver is not None:
+                self._wait = WebDriverWait(self._driver, self.wait_seconds, poll_frequency=0.1)
         return self._driver
 
     @property
@@ -64,138 +206,190 @@ class _BaseSimpleAutofill:
 
     def close(self) -> None:
         if self._driver:
-            with contextlib.suppress(WebDriverException):
-                self._driver.quit()
+            # Return the session to the pool so the next autofill skips
+            # browser startup; the pool quits broken sessions itself.
+            _DRIVER_POOL.release(self._driver)
         self._driver = None
+        self._wait = None
 
     def _log(self, msg: str) -> None:
         if self.verbose:
             print(f"[autofill.portal] {msg}")
 
+    def _click_apply(self, driver: WebDriver) -> bool:
+        if self._click_first(driver, self.APPLY_SELECTORS):
+            return True
+        with contextlib.suppress(WebDriverException):
+            return bool(driver.execute_script(_APPLY_TEXT_JS))
+        return False
+
+    def _wait_page_ready(self, driver: WebDriver) -> None:
+        """Block until the document finishes loading (no fixed sleep)."""
+        # Reuse the wait built alongside the driver; the shorter-timeout
+        # waits below construct their own.
+        wait = self._wait or WebDriverWait(driver, self.wait_seconds, poll_frequency=0.1)
+        with contextlib.suppress(TimeoutException, WebDriverException):
+            wait.until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+
     def _click_first(self, driver: WebDriver, selectors: Iterable[tuple[str, str]]) -> bool:
         for by, sel in selectors:
             for el in driver.find_elements(by, sel):
                 with contextlib.suppress(WebDriverException):
+                    prev_url = driver.current_url
                     el.click()
-                    time.sleep(0.8)
+                    # The click either navigates (apply link) or swaps the DOM
+                    # in place (apply button); wait for whichever happens first.
+                    with contextlib.suppress(TimeoutException):
+                        WebDriverWait(driver, 3, poll_frequency=0.1).until(
+                            EC.any_of(EC.staleness_of(el), EC.url_changes(prev_url))
+                        )
                     return True
         return False
 
-    def _set_value(self, driver: WebDriver, selectors: Iterable[tuple[str, str]], value: str) -> bool:
+    def _bulk_fill(self, driver: WebDriver, pairs: list[list[str]]) -> set[str]:
+        """Fill several CSS-locatable fields in one execute_script call.
+
+        Returns the set of selectors that were actually filled so callers can
+        fall back to per-field Selenium calls for the rest.
+        """
+        if not pairs:
+            return set()
+        try:
+            return set(driver.execute_script(_BULK_FILL_JS, pairs))
+        except WebDriverException:
+            return set()
+
+    def _fill_fields(self, driver: WebDriver, field_values: Iterable[tuple[tuple[str, str], str]]) -> None:
+        """Fill a batch of text fields, preferring one JS pass over N round-trips."""
+        field_values = [(locator, value) for locator, value in field_values if value]
+        filled = self._bulk_fill(
+            driver,
+            [[sel, value] for (by, sel), value in field_values if by == By.CSS_SELECTOR],
+        )
+        for locator, value in field_values:
+            if locator[0] == By.CSS_SELECTOR and locator[1] in filled:
+                continue
+            self._set_value(driver, locator, value)
+
+    def _set_value(self, driver: WebDriver, locator: tuple[str, str], value: str) -> bool:
         if not value:
             return False
-        for by, sel in selectors:
-            try:
-                el = WebDriverWait(driver, 2).until(EC.presence_of_element_located((by, sel)))
-            except TimeoutException:
-                continue
-            try:
-                el.clear()
-            except WebDriverException:
-                pass
-            with contextlib.suppress(WebDriverException):
-                el.send_keys(value)
-                return True
+        # Alternatives are comma-joined into one selector list, so a single
+        # wait covers every variant in one browser-side query.
+        try:
+            el = WebDriverWait(driver, 2).until(EC.presence_of_element_located(locator))
+        except TimeoutException:
+            return False
+        try:
+            el.clear()
+        except WebDriverException:
+            pass
+        with contextlib.suppress(WebDriverException):
+            el.send_keys(value)
+            return True
         return False
 
-    def _upload_file(self, driver: WebDriver, selectors: Iterable[tuple[str, str]], path: Path) -> bool:
-        for by, sel in selectors:
-            for el in driver.find_elements(by, sel):
-                with contextlib.suppress(WebDriverException):
-                    el.send_keys(str(path))
-                    time.sleep(1.2)
-                    return True
+    def _upload_file(self, driver: WebDriver, locator: tuple[str, str], path: Path) -> bool:
+        for el in driver.find_elements(*locator):
+            with contextlib.suppress(WebDriverException):
+                el.send_keys(str(path))
+                # Poll until the browser has registered the file instead of
+                # sleeping a fixed interval.
+                with contextlib.suppress(TimeoutException):
+                    WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                        lambda _d: el.get_attribute("value")
+                    )
+                return True
         return False
 
 
 class SimpleGreenhouseAutofill(_BaseSimpleAutofill):
     APPLY_SELECTORS: tuple[tuple[str, str], ...] = (
-        (By.XPATH, "//a[contains(translate(., 'APPLY', 'apply'),'apply')]"),
-        (By.XPATH, "//button[contains(translate(., 'APPLY', 'apply'),'apply')]"),
-    )
-    RESUME_INPUTS: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[type='file'][id*='resume'], input[type='file'][name*='resume']"),
-        (By.CSS_SELECTOR, "input[type='file'][id*='resume_cv'], input[type='file'][name*='resume_cv']"),
-    )
-    COVER_INPUTS: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[type='file'][id*='cover'], input[type='file'][name*='cover']"),
+        # Case-insensitive attribute matching runs in the browser's native
+        # selector engine, unlike the old XPath translate() DOM walk.
+        (By.CSS_SELECTOR,
+         "a[href*='apply' i], a[id*='apply' i], a[class*='apply' i], "
+         "a[aria-label*='apply' i], button[id*='apply' i], "
+         "button[class*='apply' i], button[aria-label*='apply' i], "
+         "button[data-qa*='apply' i]"),
     )
-    FIRST_NAME: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input#first_name, input[name='first_name']"),
+    # Each locator is a single comma-joined CSS list: the browser evaluates the
+    # alternatives in one querySelectorAll pass instead of one wait per variant.
+    RESUME_INPUTS: tuple[str, str] = (
+        By.CSS_SELECTOR,
+        "input[type='file'][id*='resume'], input[type='file'][name*='resume'], "
+        "input[type='file'][id*='resume_cv'], input[type='file'][name*='resume_cv']",
     )
-    LAST_NAME: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input#last_name, input[name='last_name']"),
-    )
-    EMAIL: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input#email, input[name='email']"),
-    )
-    PHONE: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input#phone, input[name='phone']"),
+    COVER_INPUTS: tuple[str, str] = (
+        By.CSS_SELECTOR, "input[type='file'][id*='cover'], input[type='file'][name*='cover']",
     )
+    FIRST_NAME: tuple[str, str] = (By.CSS_SELECTOR, "input#first_name, input[name='first_name']")
+    LAST_NAME: tuple[str, str] = (By.CSS_SELECTOR, "input#last_name, input[name='last_name']")
+    EMAIL: tuple[str, str] = (By.CSS_SELECTOR, "input#email, input[name='email']")
+    PHONE: tuple[str, str] = (By.CSS_SELECTOR, "input#phone, input[name='phone']")
 
     def fill_application(self, job_url: str, resume_path: str | None = None, cover_letter_path: str | None = None) -> bool:
         d = self.driver
         d.get(job_url)
-        time.sleep(1.5)
-        self._click_first(d, self.APPLY_SELECTORS)
-        time.sleep(1.0)
-        self._set_value(d, self.FIRST_NAME, self.profile.first_name)
-        self._set_value(d, self.LAST_NAME, self.profile.last_name)
-        self._set_value(d, self.EMAIL, self.profile.email)
-        self._set_value(d, self.PHONE, self.profile.phone)
-        if resume_path:
-            p = Path(resume_path).expanduser()
-            if p.exists():
-                self._upload_file(d, self.RESUME_INPUTS, p)
-        if cover_letter_path:
-            p = Path(cover_letter_path).expanduser()
-            if p.exists():
-                self._upload_file(d, self.COVER_INPUTS, p)
+        self._wait_page_ready(d)
+        if self._click_apply(d):
+            self._wait_page_ready(d)
+        self._fill_fields(d, (
+            (self.FIRST_NAME, self.profile.first_name),
+            (self.LAST_NAME, self.profile.last_name),
+            (self.EMAIL, self.profile.email),
+            (self.PHONE, self.profile.phone),
+        ))
+        resume_file = _existing_file(resume_path)
+        if resume_file:
+            self._upload_file(d, self.RESUME_INPUTS, resume_file)
+        cover_file = _existing_file(cover_letter_path)
+        if cover_file:
+            self._upload_file(d, self.COVER_INPUTS, cover_file)
         self._log("Finished Greenhouse autofill.")
         return True
 
 
 class SimpleLeverAutofill(_BaseSimpleAutofill):
     APPLY_SELECTORS: tuple[tuple[str, str], ...] = (
-        (By.XPATH, "//a[contains(translate(., 'APPLY', 'apply'),'apply')]"),
-        (By.XPATH, "//button[contains(translate(., 'APPLY', 'apply'),'apply')]"),
-    )
-    RESUME_INPUTS: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[type='file'][name*='resume']"),
-        (By.CSS_SELECTOR, "input[type='file'][data-qa*='resume']"),
-    )
-    COVER_INPUTS: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[type='file'][name*='cover']"),
-    )
-    NAME: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[name='name'], input#name"),
-    )
-    EMAIL: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[name='email'], input#email"),
+        # Case-insensitive attribute matching runs in the browser's native
+        # selector engine, unlike the old XPath translate() DOM walk.
+        (By.CSS_SELECTOR,
+         "a[href*='apply' i], a[id*='apply' i], a[class*='apply' i], "
+         "a[aria-label*='apply' i], button[id*='apply' i], "
+         "button[class*='apply' i], button[aria-label*='apply' i], "
+         "button[data-qa*='apply' i]"),
     )
-    PHONE: tuple[tuple[str, str], ...] = (
-        (By.CSS_SELECTOR, "input[name='phone'], input#phone"),
+    RESUME_INPUTS: tuple[str, str] = (
+        By.CSS_SELECTOR,
+        "input[type='file'][name*='resume'], input[type='file'][data-qa*='resume']",
     )
+    COVER_INPUTS: tuple[str, str] = (By.CSS_SELECTOR, "input[type='file'][name*='cover']")
+    NAME: tuple[str, str] = (By.CSS_SELECTOR, "input[name='name'], input#name")
+    EMAIL: tuple[str, str] = (By.CSS_SELECTOR, "input[name='email'], input#email")
+    PHONE: tuple[str, str] = (By.CSS_SELECTOR, "input[name='phone'], input#phone")
 
     def fill_application(self, job_url: str, resume_path: str | None = None, cover_letter_path: str | None = None) -> bool:
         d = self.driver
         d.get(job_url)
-        time.sleep(1.5)
-        self._click_first(d, self.APPLY_SELECTORS)
-        time.sleep(1.0)
+        self._wait_page_ready(d)
+        if self._click_apply(d):
+            self._wait_page_ready(d)
         # Lever commonly has a single name field
         full_name = f"{self.profile.first_name} {self.profile.last_name}".strip()
-        self._set_value(d, self.NAME, full_name)
-        self._set_value(d, self.EMAIL, self.profile.email)
-        self._set_value(d, self.PHONE, self.profile.phone)
-        if resume_path:
-            p = Path(resume_path).expanduser()
-            if p.exists():
-                self._upload_file(d, self.RESUME_INPUTS, p)
-        if cover_letter_path:
-            p = Path(cover_letter_path).expanduser()
-            if p.exists():
-                self._upload_file(d, self.COVER_INPUTS, p)
+        self._fill_fields(d, (
+            (self.NAME, full_name),
+            (self.EMAIL, self.profile.email),
+            (self.PHONE, self.profile.phone),
+        ))
+        resume_file = _existing_file(resume_path)
+        if resume_file:
+            self._upload_file(d, self.RESUME_INPUTS, resume_file)
+        cover_file = _existing_file(cover_letter_path)
+        if cover_file:
+            self._upload_file(d, self.COVER_INPUTS, cover_file)
         self._log("Finished Lever autofill.")
         return True
 
@@ -4,33 +4,32 @@ Quick Apply Web App - Flask Backend
 Generate tailored resume and cover letter through a web interface
 """
 
-from flask import Flask, render_template, request, jsonify, send_file, send_from_directory
+from flask import Flask, render_template, request, jsonify, send_file, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 import os
 import json
 from pathlib import Path
 import tempfile
 import shutil
+import threading
+import time
+import uuid
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import traceback
 
-# Import existing modules
-from match import (
-    fetch_job_description_from_url,
-    score_job,
-    load_resume_data,
-    run_discovery,
-    resolve_from_config
-)
-from enhanced_prompts import ENHANCED_RESUME_PROMPT, ENHANCED_COVER_LETTER_PROMPT
-from pdf_generator import PDFGenerator
-from docx_generator import WordDocumentGenerator
-from llm_manager import LLMManager
-from resume_utils import render_resume_from_yaml
-from resume_parser import parse_resume_file
+# Heavy modules (reportlab, python-docx, LLM SDKs, the match pipeline) are
+# imported lazily inside the handlers that need them so worker boot and
+# /api/health don't pay hundreds of ms of import time. After the first use
+# they come from sys.modules at dict-lookup cost.
 import re
-from docx import Document as DocxDocument
-from PyPDF2 import PdfReader
+import string
+
+# orjson decodes/encodes 2-5x faster than stdlib json; fall back when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 app = Flask(__name__)
 CORS(app)
@@ -40,49 +39,150 @@ app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['UPLOAD_FOLDER'] = 'output/web_uploads'
 app.config['OUTPUT_FOLDER'] = 'output/web_output'
 
+# Base directories resolved once at startup; handlers reuse these instead of
+# rebuilding Path objects from app.config per request
+UPLOAD_DIR = Path(app.config['UPLOAD_FOLDER']).resolve()
+OUTPUT_DIR = Path(app.config['OUTPUT_FOLDER']).resolve()
+
 # Ensure directories exist
-Path(app.config['UPLOAD_FOLDER']).mkdir(parents=True, exist_ok=True)
-Path(app.config['OUTPUT_FOLDER']).mkdir(parents=True, exist_ok=True)
+UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Precompiled patterns (hot request path - avoid re-parsing per call)
+#
+# _PORTAL_RE detects the job portal and captures the company slug in one
+# left-to-right alternation pass. The bare greenhouse/lever branch exists so
+# portal URLs without a recognizable slug don't fall through to the generic
+# domain branch.
+_PORTAL_RE = re.compile(
+    r'https?://(?:'
+    r'[^/]*boards\.greenhouse\.io/(?P<gh>[^/]+)'
+    r'|jobs\.lever\.co/(?P<lv>[^/]+)'
+    r'|(?P<google>careers\.google\.com)'
+    r'|(?P<portal>[^/]*(?:greenhouse\.io|lever\.co))'
+    r'|(?:www\.|careers\.)?(?P<other>[^/\.]+)'
+    r')',
+    re.I,
+)
+_FILENAME_SAFE_RE = re.compile(r'[^a-zA-Z0-9_.-]')
+# One C-level table pass replaces the old strip-punctuation regex plus the
+# separate ' ' -> '_' replace when building output names
+_SAFE_TRANS = str.maketrans({' ': '_', **{c: '' for c in string.punctuation if c not in '-_'}})
+
+
+# Background task registries: generation and discovery both run in daemon
+# threads and report progress through these dicts.
+generation_tasks = {}
+generation_lock = threading.Lock()
+discovery_tasks = {}
+discovery_lock = threading.Lock()
+
+# Finished task entries (including their result payloads) would otherwise
+# accumulate for the life of the worker; prune them once they are old
+# enough that no client is still polling.
+TASK_TTL_SECONDS = 3600
+
+
+def _prune_tasks(tasks, running_status='running'):
+    """Drop finished tasks older than the TTL. Call while holding the lock."""
+    cutoff = time.time() - TASK_TTL_SECONDS
+    expired = [
+        task_id for task_id, task in tasks.items()
+        if task['status'] != running_status and task['start_time'] < cutoff
+    ]
+    for task_id in expired:
+        del tasks[task_id]
+
+def _file_exists(path) -> bool:
+    """One stat syscall; skips Path.exists() machinery on hot request paths"""
+    try:
+        os.stat(path)
+        return True
+    except OSError:
+        return False
+
+
+def parse_json_request():
+    """Decode the JSON request body, preferring orjson over stdlib json"""
+    if orjson is not None:
+        try:
+            return orjson.loads(request.get_data(cache=False) or b"{}")
+        except orjson.JSONDecodeError:
+            return None
+    return request.get_json(cache=False, silent=True)
+
+
+def json_response(payload, status=200):
+    """Serialize a response payload, preferring orjson over jsonify"""
+    if orjson is not None:
+        return app.response_class(orjson.dumps(payload), status=status, mimetype='application/json')
+    return app.response_class(json.dumps(payload), status=status, mimetype='application/json')
+
+
+# Parsed config.json, reloaded only when the file's mtime changes
+_CONFIG_CACHE = {"mtime": 0, "data": None}
 
 
 def load_config():
-    """Load configuration from config.json"""
+    """Load configuration from config.json (cached until the file changes)"""
     config_path = Path("config.json")
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
+        _CONFIG_CACHE["mtime"] = 0
+        _CONFIG_CACHE["data"] = None
         return None
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    if _CONFIG_CACHE["data"] is None or _CONFIG_CACHE["mtime"] != mtime:
+        with open(config_path, 'r') as f:
+            _CONFIG_CACHE["data"] = json.load(f)
+        _CONFIG_CACHE["mtime"] = mtime
+    return _CONFIG_CACHE["data"]
+
+
+# input/resume.yml parsed and rendered once, reused until the file changes
+_RESUME_CACHE = {"mtime": 0, "text": None, "data": None, "rendered": None}
+
+
+def load_cached_resume(resume_path: Path):
+    """load_resume_data + render_resume_from_yaml, cached on the file's mtime.
+
+    Returns (raw_text, resume_data, rendered_text); all None when the file
+    is missing or fails to load.
+    """
+    try:
+        mtime = resume_path.stat().st_mtime_ns
+    except OSError:
+        return None, None, None
+    if _RESUME_CACHE["data"] is None or _RESUME_CACHE["mtime"] != mtime:
+        from match import load_resume_data
+        from resume_utils import render_resume_from_yaml
+
+        text, data = load_resume_data(resume_path)
+        if not data:
+            return text, data, None
+        _RESUME_CACHE["mtime"] = mtime
+        _RESUME_CACHE["text"] = text
+        _RESUME_CACHE["data"] = data
+        _RESUME_CACHE["rendered"] = render_resume_from_yaml(data)
+    return _RESUME_CACHE["text"], _RESUME_CACHE["data"], _RESUME_CACHE["rendered"]
 
 
 def extract_job_info_from_url(url: str):
     """Extract company name and job title from URL"""
     company = None
     title = None
-    
-    url_lower = url.lower()
-    
-    # Greenhouse
-    if 'greenhouse.io' in url_lower:
-        match = re.search(r'boards\.greenhouse\.io/([^/]+)', url)
-        if match:
-            company = match.group(1).replace('-', ' ').title()
-    
-    # Lever
-    elif 'lever.co' in url_lower:
-        match = re.search(r'jobs\.lever\.co/([^/]+)', url)
-        if match:
-            company = match.group(1).replace('-', ' ').title()
-    
-    # Google
-    elif 'careers.google.com' in url_lower:
-        company = "Google"
-    
-    # General domain extraction
-    else:
-        match = re.search(r'https?://(?:www\.|careers\.)?([^/\.]+)', url)
-        if match:
-            company = match.group(1).title()
-    
+
+    match = _PORTAL_RE.match(url)
+    if match:
+        if match.group('gh'):
+            company = match.group('gh').replace('-', ' ').title()
+        elif match.group('lv'):
+            company = match.group('lv').replace('-', ' ').title()
+        elif match.group('google'):
+            company = "Google"
+        elif match.group('other'):
+            company = match.group('other').title()
+
     return company, title
 
 
@@ -293,6 +393,8 @@ def extract_text_from_resume_file(file_path: Path) -> str:
     suffix = file_path.suffix.lower()
     if suffix == ".pdf":
         try:
+            from PyPDF2 import PdfReader
+
             reader = PdfReader(str(file_path))
             texts = []
             for page in reader.pages:
@@ -306,6 +408,8 @@ def extract_text_from_resume_file(file_path: Path) -> str:
             return ""
     elif suffix in (".docx",):
         try:
+            from docx import Document as DocxDocument
+
             doc = DocxDocument(str(file_path))
             return "\n".join([p.text for p in doc.paragraphs]).strip()
         except Exception as e:
@@ -324,8 +428,25 @@ def generate_documents(
     config,
     base_resume_text: str | None = None,
     basics_override: dict | None = None,
+    rendered_resume_text: str | None = None,
+    progress_cb=None,
 ):
     """Generate resume and cover letter"""
+
+    def _notify(event: str) -> None:
+        if progress_cb:
+            try:
+                progress_cb(event)
+            except Exception:
+                pass
+
+    from enhanced_prompts import build_resume_prompt, build_cover_letter_prompt
+    from match import score_job
+    from pdf_generator import PDFGenerator
+    from docx_generator import WordDocumentGenerator
+    from llm_manager import LLMManager
+    from resume_utils import render_resume_from_yaml
+
     # Apply basics overlap/override early to resume_data
     if basics_override and "basics" in resume_data:
         resume_data["basics"] = {**resume_data["basics"], **basics_override}
@@ -336,6 +457,9 @@ def generate_documents(
         # was provided, prefer that text as the base; otherwise use YAML.
         if base_resume_text and base_resume_text.strip():
             resume_text = base_resume_text.strip()
+        elif rendered_resume_text:
+            # Caller already holds a cached render of this resume_data
+            resume_text = rendered_resume_text
         else:
             resume_text = render_resume_from_yaml(resume_data)
 
@@ -346,23 +470,32 @@ def generate_documents(
         try:
             llm_manager = LLMManager(config)
 
-            # Generate resume with LLM
-            resume_prompt = ENHANCED_RESUME_PROMPT.format(
+            resume_prompt = build_resume_prompt(
                 company_name=company_name,
                 job_title=job_title,
                 job_description=job_description,
                 resume_text=resume_text,
             )
-            tailored_resume = llm_manager.generate(resume_prompt, max_tokens=6000)
-
-            # Generate cover letter with LLM
-            cover_letter_prompt = ENHANCED_COVER_LETTER_PROMPT.format(
+            cover_letter_prompt = build_cover_letter_prompt(
                 company_name=company_name,
                 job_title=job_title,
                 job_description=job_description,
                 resume_text=resume_text,
             )
-            cover_letter = llm_manager.generate(cover_letter_prompt, max_tokens=1500)
+
+            # The two generations are independent provider calls; running them
+            # concurrently cuts wall-clock from t_resume + t_cover to max(...).
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                resume_future = executor.submit(
+                    llm_manager.generate, resume_prompt, max_tokens=6000
+                )
+                cover_future = executor.submit(
+                    llm_manager.generate, cover_letter_prompt, max_tokens=1500
+                )
+                tailored_resume = resume_future.result()
+                _notify('resume_llm_done')
+                cover_letter = cover_future.result()
+                _notify('cover_llm_done')
         except Exception as llm_error:
             # LLM completely unavailable (no keys, quotas, etc.) – fall back.
             # IMPORTANT: Do NOT change `resume_text` here. We keep whichever
@@ -404,13 +537,13 @@ def generate_documents(
         
         # Create unique output directory
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_company = re.sub(r'[^\w\s-]', '', company_name)[:30]
-        safe_title = re.sub(r'[^\w\s-]', '', job_title)[:30]
-        output_dir = Path(app.config['OUTPUT_FOLDER']) / f"{timestamp}_{safe_company}_{safe_title}".replace(' ', '_')
+        safe_company = company_name.translate(_SAFE_TRANS)[:30]
+        safe_title = job_title.translate(_SAFE_TRANS)[:30]
+        output_dir = OUTPUT_DIR / f"{timestamp}_{safe_company}_{safe_title}"
         output_dir.mkdir(parents=True, exist_ok=True)
-        
+
         # Generate files
-        base_name = f"{safe_company}_{safe_title}".replace(' ', '_')
+        base_name = f"{safe_company}_{safe_title}"
         
         resume_pdf = output_dir / f"{base_name}_resume.pdf"
         resume_docx = output_dir / f"{base_name}_resume.docx"
@@ -423,36 +556,45 @@ def generate_documents(
         candidate_email = basics.get("email", "")
         candidate_phone = basics.get("phone", "")
         
-        pdf_gen.generate_resume_pdf(
-            enhanced_resume, str(resume_pdf),
-            job_title=job_title, company_name=company_name,
-            candidate_name=candidate_name, structured=resume_data
-        )
-        
-        docx_gen.generate_resume_docx(
-            enhanced_resume, str(resume_docx),
-            job_title=job_title, company_name=company_name,
-            candidate_name=candidate_name, structured=resume_data
-        )
-        
-        pdf_gen.generate_cover_letter_pdf(
-            cover_letter, str(cover_pdf),
-            job_title=job_title,
-            company_name=company_name,
-            candidate_name=candidate_name,
-            candidate_email=candidate_email,
-            candidate_phone=candidate_phone,
-        )
-        
-        docx_gen.generate_cover_letter_docx(
-            cover_letter,
-            str(cover_docx),
-            job_title=job_title,
-            company_name=company_name,
-            candidate_name=candidate_name,
-            candidate_email=candidate_email,
-            candidate_phone=candidate_phone,
-        )
+        # The four document writes are independent; render them in parallel so
+        # the file-generation phase costs max(t_i) instead of sum(t_i).
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            doc_futures = [
+                executor.submit(
+                    pdf_gen.generate_resume_pdf,
+                    enhanced_resume, str(resume_pdf),
+                    job_title=job_title, company_name=company_name,
+                    candidate_name=candidate_name, structured=resume_data,
+                ),
+                executor.submit(
+                    docx_gen.generate_resume_docx,
+                    enhanced_resume, str(resume_docx),
+                    job_title=job_title, company_name=company_name,
+                    candidate_name=candidate_name, structured=resume_data,
+                ),
+                executor.submit(
+                    pdf_gen.generate_cover_letter_pdf,
+                    cover_letter, str(cover_pdf),
+                    job_title=job_title,
+                    company_name=company_name,
+                    candidate_name=candidate_name,
+                    candidate_email=candidate_email,
+                    candidate_phone=candidate_phone,
+                ),
+                executor.submit(
+                    docx_gen.generate_cover_letter_docx,
+                    cover_letter,
+                    str(cover_docx),
+                    job_title=job_title,
+                    company_name=company_name,
+                    candidate_name=candidate_name,
+                    candidate_email=candidate_email,
+                    candidate_phone=candidate_phone,
+                ),
+            ]
+            for future in doc_futures:
+                future.result()
+        _notify('documents_done')
         
         # Calculate match score
         job_dict = {
@@ -478,16 +620,19 @@ def generate_documents(
             'match_score': round(match_score, 1),
             'score_explanation': score_explanation,
             'files': {
-                'resume_pdf': str(resume_pdf.relative_to(app.config['OUTPUT_FOLDER'])),
-                'resume_docx': str(resume_docx.relative_to(app.config['OUTPUT_FOLDER'])),
-                'cover_letter_pdf': str(cover_pdf.relative_to(app.config['OUTPUT_FOLDER'])),
-                'cover_letter_docx': str(cover_docx.relative_to(app.config['OUTPUT_FOLDER']))
+                'resume_pdf': str(resume_pdf.relative_to(OUTPUT_DIR)),
+                'resume_docx': str(resume_docx.relative_to(OUTPUT_DIR)),
+                'cover_letter_pdf': str(cover_pdf.relative_to(OUTPUT_DIR)),
+                'cover_letter_docx': str(cover_docx.relative_to(OUTPUT_DIR))
             },
-            'output_dir': str(output_dir.relative_to(app.config['OUTPUT_FOLDER']))
+            'output_dir': str(output_dir.relative_to(OUTPUT_DIR))
         }, None
         
     except Exception as e:
-        return None, f"Error: {str(e)}\n{traceback.format_exc()}"
+        # Full traceback goes to the server log only; formatting it into the
+        # response wastes CPU on the failure path and leaks internals.
+        app.logger.exception("generate_documents failed")
+        return None, f"Error: {str(e)}"
 
 
 @app.route('/')
@@ -514,22 +659,27 @@ def health_check():
 
 @app.route('/api/generate', methods=['POST'])
 def generate():
-    """Generate resume and cover letter from job link or description"""
+    """Start resume/cover-letter generation and return a task id immediately.
+
+    The LLM calls + document rendering take 10-30s; instead of holding the
+    HTTP request open the work runs in a background thread and the client
+    polls /api/status/<task_id> or subscribes to /api/stream/<task_id>.
+    """
     try:
-        data = request.json
-        
+        data = parse_json_request() or {}
+
         # Validate input
         job_link = data.get('job_link', '').strip()
         job_description = data.get('job_description', '').strip()
         company_name = data.get('company', '').strip()
         job_title = data.get('title', '').strip()
-        
+
         if not job_link and not job_description:
             return jsonify({
                 'success': False,
                 'error': 'Either job_link or job_description is required'
             }), 400
-        
+
         # Load configuration
         config = load_config()
         if not config:
@@ -537,64 +687,98 @@ def generate():
                 'success': False,
                 'error': 'Configuration not found (config.json)'
             }), 500
-        
-        # Load base resume from YAML
+
+        # Load base resume from YAML (cached across requests)
         resume_path = Path("input/resume.yml")
-        if not resume_path.exists():
-            return jsonify({
-                'success': False,
-                'error': 'Resume file not found (input/resume.yml)'
-            }), 500
-        
-        _, resume_data = load_resume_data(resume_path)
+        _, resume_data, rendered_resume_text = load_cached_resume(resume_path)
         if not resume_data:
             return jsonify({
                 'success': False,
-                'error': 'Failed to load resume data'
+                'error': 'Failed to load resume data (input/resume.yml)'
             }), 500
-        
-        # Fetch job description if URL provided
-        if job_link:
-            job_description = fetch_job_description_from_url(job_link)
-            if not job_description:
-                return jsonify({
-                    'success': False,
-                    'error': 'Failed to fetch job description from URL'
-                }), 400
-            
-            # Try to extract company and title from URL
-            if not company_name or not job_title:
-                extracted_company, extracted_title = extract_job_info_from_url(job_link)
-                if not company_name and extracted_company:
-                    company_name = extracted_company
-                if not job_title and extracted_title:
-                    job_title = extracted_title
-        
-        # Use defaults if still missing
-        if not company_name:
-            company_name = "Target Company"
-        if not job_title:
-            job_title = "Desired Role"
-        
-        # Generate documents (using YAML-based resume as base)
-        result, error = generate_documents(
-            job_description=job_description,
-            company_name=company_name,
-            job_title=job_title,
-            resume_data=resume_data,
-            config=config,
-            base_resume_text=None,
-            basics_override=None,
-        )
-        
-        if error:
-            return jsonify({
-                'success': False,
-                'error': error
-            }), 500
-        
-        return jsonify(result)
-        
+
+        task_id = str(uuid.uuid4())
+        with generation_lock:
+            _prune_tasks(generation_tasks)
+            generation_tasks[task_id] = {
+                'status': 'running',
+                'start_time': time.time(),
+                'events': [],
+                'result': None,
+                'error': None,
+            }
+
+        def _record_event(event):
+            with generation_lock:
+                task = generation_tasks.get(task_id)
+                if task is not None:
+                    task['events'].append(event)
+
+        def _finish(status, result=None, error=None):
+            with generation_lock:
+                task = generation_tasks.get(task_id)
+                if task is not None:
+                    task.update({'status': status, 'result': result, 'error': error})
+
+        def background_generate(job_link, job_description, company_name, job_title):
+            try:
+                from match import fetch_job_description_from_url
+
+                # Fetch job description if URL provided (slow; keep off the
+                # request thread)
+                if job_link:
+                    job_description = fetch_job_description_from_url(job_link)
+                    if not job_description:
+                        _finish('failed', error='Failed to fetch job description from URL')
+                        return
+                    _record_event('job_description_fetched')
+
+                    # Try to extract company and title from URL
+                    if not company_name or not job_title:
+                        extracted_company, extracted_title = extract_job_info_from_url(job_link)
+                        if not company_name and extracted_company:
+                            company_name = extracted_company
+                        if not job_title and extracted_title:
+                            job_title = extracted_title
+
+                # Use defaults if still missing
+                if not company_name:
+                    company_name = "Target Company"
+                if not job_title:
+                    job_title = "Desired Role"
+
+                # Generate documents (using YAML-based resume as base)
+                result, error = generate_documents(
+                    job_description=job_description,
+                    company_name=company_name,
+                    job_title=job_title,
+                    resume_data=dict(resume_data),
+                    config=config,
+                    base_resume_text=None,
+                    basics_override=None,
+                    rendered_resume_text=rendered_resume_text,
+                    progress_cb=_record_event,
+                )
+                if error:
+                    _finish('failed', error=error)
+                else:
+                    _finish('completed', result=result)
+            except Exception as e:
+                _finish('failed', error=f'Server error: {str(e)}')
+
+        threading.Thread(
+            target=background_generate,
+            args=(job_link, job_description, company_name, job_title),
+            daemon=True
+        ).start()
+
+        return json_response({
+            'success': True,
+            'task_id': task_id,
+            'status_url': f'/api/status/{task_id}',
+            'stream_url': f'/api/stream/{task_id}'
+        }, status=202)
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -602,13 +786,60 @@ def generate():
         }), 500
 
 
+@app.route('/api/status/<task_id>')
+def generation_status(task_id):
+    """Poll the state of a background generation task"""
+    with generation_lock:
+        task = generation_tasks.get(task_id)
+        if task is None:
+            return jsonify({'success': False, 'error': 'Unknown task id'}), 404
+        payload = {
+            'success': True,
+            'status': task['status'],
+            'events': list(task['events']),
+        }
+        if task['status'] == 'completed':
+            payload['result'] = task['result']
+        elif task['status'] == 'failed':
+            payload['error'] = task['error']
+    return json_response(payload)
+
+
+@app.route('/api/stream/<task_id>')
+def generation_stream(task_id):
+    """Server-Sent Events feed of generation progress"""
+    def event_stream():
+        sent = 0
+        while True:
+            with generation_lock:
+                task = generation_tasks.get(task_id)
+                if task is None:
+                    yield "event: error\ndata: Unknown task id\n\n"
+                    return
+                pending = task['events'][sent:]
+                status = task['status']
+                final = task['result'] if status == 'completed' else {'error': task['error']}
+            for event in pending:
+                sent += 1
+                yield f"data: {event}\n\n"
+            if status in ('completed', 'failed'):
+                yield f"event: {status}\ndata: {json.dumps(final)}\n\n"
+                return
+            time.sleep(0.5)
+
+    return Response(stream_with_context(event_stream()), mimetype='text/event-stream')
+
+
 @app.route('/api/discover', methods=['POST'])
 def discover():
     """Discover jobs based on resume keywords"""
     try:
-        data = request.json or {}
+        from match import load_resume_data, resolve_from_config, run_discovery
+        from resume_parser import parse_resume_file
+
+        data = parse_json_request() or {}
         resume_id = data.get('resume_id')
-        
+
         # Load configuration
         config = load_config() or {}
         resolved_cfg = resolve_from_config(config)
@@ -623,10 +854,9 @@ def discover():
         
         if resume_file and resume_file.filename != '':
             # Handle uploaded resume file
-            upload_dir = Path(app.config['UPLOAD_FOLDER'])
-            upload_dir.mkdir(parents=True, exist_ok=True)
+            upload_dir = UPLOAD_DIR
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_name = re.sub(r'[^a-zA-Z0-9_.-]', '_', resume_file.filename)
+            safe_name = _FILENAME_SAFE_RE.sub('_', resume_file.filename)
             saved_path = upload_dir / f"{timestamp}_{safe_name}"
             resume_file.save(str(saved_path))
             
@@ -638,15 +868,15 @@ def discover():
             # Determine resume path from ID or fallback
             resume_path = None
             if resume_id:
-                resume_path = Path(app.config['UPLOAD_FOLDER']) / resume_id
+                resume_path = UPLOAD_DIR / resume_id
             else:
                 # Fallback to default YAML
                 resume_path = Path("input/resume.yml")
-                if not resume_path.exists():
+                if not _file_exists(resume_path):
                     # Try common text location
                     resume_path = Path("input/resume.txt")
-            
-            if resume_path and resume_path.exists():
+
+            if resume_path and _file_exists(resume_path):
                 # Load resume data
                 resume_text, resume_structured = load_resume_data(resume_path)
                 print(f"[api] Used existing resume for discovery: {resume_path}")
@@ -662,6 +892,7 @@ def discover():
         
         # Initial status
         with discovery_lock:
+            _prune_tasks(discovery_tasks, running_status='searching')
             discovery_tasks[task_id] = {
                 'status': 'searching',
                 'start_time': time.time(),
@@ -713,6 +944,9 @@ def discover():
 def generate_with_resume():
     """Generate resume & cover letter using an uploaded resume (PDF/DOCX) as base."""
     try:
+        from match import fetch_job_description_from_url, load_resume_data
+        from resume_parser import parse_resume_file
+
         # Text fields from form-data
         job_link = (request.form.get('job_link') or "").strip()
         job_description = (request.form.get('job_description') or "").strip()
@@ -742,10 +976,9 @@ def generate_with_resume():
             }), 500
 
         # Try to parse the uploaded resume first
-        upload_dir = Path(app.config['UPLOAD_FOLDER'])
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        upload_dir = UPLOAD_DIR
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = re.sub(r'[^a-zA-Z0-9_.-]', '_', resume_file.filename)
+        safe_name = _FILENAME_SAFE_RE.sub('_', resume_file.filename)
         saved_path = upload_dir / f"{timestamp}_{safe_name}"
         resume_file.save(str(saved_path))
 
@@ -757,7 +990,7 @@ def generate_with_resume():
         # Fallback to input/resume.yml for sections we might have missed or if parsing failed
         resume_path = Path("input/resume.yml")
         fallback_data = None
-        if resume_path.exists():
+        if _file_exists(resume_path):
             _, fallback_data = load_resume_data(resume_path)
 
         # Merge or prioritize uploaded data:
@@ -829,6 +1062,8 @@ def generate_with_resume():
 def parse_resume_endpoint():
     """Pure resume parsing endpoint: return structured JSON from uploaded resume."""
     try:
+        from resume_parser import parse_resume_file
+
         resume_file = request.files.get('resume_file')
         if not resume_file or resume_file.filename == '':
             return jsonify({
@@ -836,10 +1071,9 @@ def parse_resume_endpoint():
                 'error': 'resume_file is required'
             }), 400
 
-        upload_dir = Path(app.config['UPLOAD_FOLDER'])
-        upload_dir.mkdir(parents=True, exist_ok=True)
+        upload_dir = UPLOAD_DIR
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = re.sub(r'[^a-zA-Z0-9_.-]', '_', resume_file.filename)
+        safe_name = _FILENAME_SAFE_RE.sub('_', resume_file.filename)
         saved_path = upload_dir / f"{timestamp}_{safe_name}"
         resume_file.save(str(saved_path))
 
@@ -857,18 +1091,34 @@ def parse_resume_endpoint():
         }), 500
 
 
+# When the app sits behind nginx, set ACCEL_REDIRECT_PREFIX to an internal
+# location mapped to the output folder; downloads are then served by nginx
+# directly (kernel zero-copy) instead of streaming through Python.
+_ACCEL_PREFIX = os.getenv('ACCEL_REDIRECT_PREFIX')
+
+
 @app.route('/api/download/<path:filename>')
 def download_file(filename):
     """Download generated file"""
     try:
-        file_path = Path(app.config['OUTPUT_FOLDER']) / filename
-        if not file_path.exists():
+        file_path = (OUTPUT_DIR / filename).resolve()
+        if not file_path.is_relative_to(OUTPUT_DIR) or not _file_exists(file_path):
             return jsonify({'error': 'File not found'}), 404
-        
-        return send_file(
-            file_path,
+
+        if _ACCEL_PREFIX:
+            response = Response(mimetype='application/octet-stream')
+            response.headers['X-Accel-Redirect'] = f"{_ACCEL_PREFIX}/{file_path.relative_to(OUTPUT_DIR)}"
+            response.headers['Content-Disposition'] = f'attachment; filename="{file_path.name}"'
+            return response
+
+        # Under gunicorn this goes through wsgi.file_wrapper, i.e. sendfile(2)
+        # on Linux; conditional=True additionally enables 304s and Range.
+        return send_from_directory(
+            OUTPUT_DIR,
+            file_path.relative_to(OUTPUT_DIR),
             as_attachment=True,
-            download_name=file_path.name
+            download_name=file_path.name,
+            conditional=True,
         )
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -878,13 +1128,16 @@ def download_file(filename):
 def preview_file(filename):
     """Preview PDF file in browser"""
     try:
-        file_path = Path(app.config['OUTPUT_FOLDER']) / filename
-        if not file_path.exists():
+        file_path = (OUTPUT_DIR / filename).resolve()
+        if not file_path.is_relative_to(OUTPUT_DIR) or not _file_exists(file_path):
             return jsonify({'error': 'File not found'}), 404
         
-        return send_file(
-            file_path,
-            mimetype='application/pdf'
+        return send_from_directory(
+            OUTPUT_DIR,
+            file_path.relative_to(OUTPUT_DIR),
+            mimetype='application/pdf',
+            conditional=True,
+            max_age=3600,
         )
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -894,8 +1147,17 @@ if __name__ == '__main__':
     print("🚀 Quick Apply Web App Starting...")
     print("📝 Make sure config.json is configured with API keys")
     print("📄 Make sure input/resume.yml exists")
-    print("\n🌐 Open http://localhost:5000 in your browser")
-    print("\nPress Ctrl+C to stop\n")
-    
-    app.run(debug=True, host='0.0.0.0', port=5000)
+
+    if os.getenv('FLASK_DEV'):
+        print("\n🌐 Open http://localhost:5000 in your browser")
+        print("\nPress Ctrl+C to stop\n")
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # Werkzeug's dev server serializes requests, which is catastrophic
+        # when each request blocks on multi-second LLM calls; gthread keeps
+        # many I/O-bound requests in flight per worker.
+        print("\n⚠️  Not starting the single-threaded dev server.")
+        print("   Run the app with threaded workers instead:")
+        print("   gunicorn -w 1 -k gthread --threads 16 -b 0.0.0.0:5000 web_app:app")
+        print("   (or set FLASK_DEV=1 to force the Werkzeug dev server)")
 
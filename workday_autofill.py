@@ -1,45 +1,564 @@
+"""
+Selenium autofill for Workday-hosted application forms.
+
+Fills the contact-information step of a Workday application (and uploads the
+tailored resume / cover letter) without submitting. Handles the sign-in /
+create-account wall via credentials passed in by the pipeline.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Mapping
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from portal_autofill import WebDriverPool
+
+
+# Browser startup costs seconds per URL; parking warm sessions here lets
+# consecutive fill_application runs skip it entirely.
+_DRIVER_POOL = WebDriverPool()
+atexit.register(_DRIVER_POOL.shutdown)
+
+
+# One case-insensitive scan replaces five substring passes over a lowercase
+# copy; the old wd1.myworkdayjobs.com pattern is subsumed by myworkdayjobs.com.
+_WORKDAY_RE = re.compile(r"(?i)(?:myworkdayjobs|workdayjobs|workday|myworkday)\.com")
+
+
+def is_workday_url(url: str | None) -> bool:
+    return bool(url) and _WORKDAY_RE.search(url) is not None
+
+
+# Batch runs reuse the same resume/cover letter for every URL; cache the
+# decoded text (keyed by mtime, so a regenerated file is re-read) and
+# positive stat() results instead of hitting the filesystem per page.
+# Misses are deliberately not cached: the pipeline may write the file
+# after the first check.
+_TEXT_CACHE: dict[str, tuple[float, str]] = {}
+_EXISTS_CACHE: set[str] = set()
+
+
+def _read_text_cached(path: str) -> str:
+    mtime = os.stat(path).st_mtime
+    cached = _TEXT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    text = Path(path).read_text(encoding="utf-8")
+    _TEXT_CACHE[path] = (mtime, text)
+    return text
+
+
+def _file_exists(path: str) -> bool:
+    if path in _EXISTS_CACHE:
+        return True
+    try:
+        os.stat(path)
+    except OSError:
+        return False
+    _EXISTS_CACHE.add(path)
+    return True
+
+
+def default_driver_factory(headless: bool = True) -> WebDriver:
+    """Chrome tuned for form filling: no images, eager loads, new headless.
+
+    Autofill only needs the DOM, so skipping image downloads cuts page
+    weight substantially on typical Workday postings, and the eager page
+    load strategy returns from driver.get on DOMContentLoaded — the
+    explicit waits in WorkdayAutofill cover everything after that.
+    """
+    from selenium import webdriver
+
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    options.page_load_strategy = "eager"
+    return webdriver.Chrome(options=options)
+
+
+@dataclass(frozen=True)
+class CandidateProfile:
+    first_name: str
+    last_name: str
+    email: str
+    phone: str = ""
+    address_line: str = ""
+    city: str = ""
+    state: str = ""
+    postal_code: str = ""
+    country: str = ""
+
+    REQUIRED_FIELDS = ("first_name", "last_name", "email")
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, Any]) -> "CandidateProfile":
+        data = {
+            key: str(mapping.get(key) or "").strip()
+            for key in (
+                "first_name",
+                "last_name",
+                "email",
+                "phone",
+                "address_line",
+                "city",
+                "state",
+                "postal_code",
+                "country",
+            )
+        }
+        missing = [key for key in cls.REQUIRED_FIELDS if not data[key]]
+        if missing:
+            raise ValueError(
+                f"Autofill profile is missing required fields: {', '.join(missing)}"
+            )
+        return cls(**data)
+
+    # The profile is frozen, so both views are computed once per instance
+    # instead of rebuilt on every page.
+    @functools.cached_property
+    def as_contact_dict(self) -> dict[str, str]:
+        return {
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "email": self.email,
+            "phone": self.phone,
+            "address_line": self.address_line,
+            "city": self.city,
+            "state": self.state,
+            "postal_code": self.postal_code,
+            "country": self.country,
+        }
+
+    @functools.cached_property
+    def _non_empty_items(self) -> tuple[tuple[str, str], ...]:
+        return tuple((key, value) for key, value in self.as_contact_dict.items() if value)
+
+
+class WorkdayAutofill:
+    """Fills a Workday application form via Selenium.
+
+    This class relies exclusively on explicit waits. The driver's implicit
+    wait is zeroed on acquisition (factories like create_chrome_driver set
+    one), so the non-blocking selector probes return immediately on a miss
+    instead of stacking the implicit timeout onto every scan.
+    """
+
+    # Workday stamps data-automation-id on its controls, and CSS matching
+    # runs on the browser's native fast path; text-matching XPath is kept
+    # only as a last resort, OR-joined so the fallback costs one round-trip.
+    APPLY_BUTTON_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "a[data-automation-id='adventureButton']"),
+        (By.CSS_SELECTOR, "a[data-uxi-element-id*='Apply']"),
+        (By.CSS_SELECTOR, "button[data-automation-id='applyButton']"),
+        (By.XPATH,
+         "//a[contains(translate(., 'APLY', 'aply'), 'apply')]"
+         " | //button[contains(translate(., 'APLY', 'aply'), 'apply')]"),
+    )
+    APPLICATION_IFRAME_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "iframe[data-automation-id='applicationFrame']"),
+        (By.CSS_SELECTOR, "iframe[src*='myworkday']"),
+    )
+    SECTION_TOGGLES: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "button[aria-expanded='false'][data-automation-id*='section']"),
+        (By.CSS_SELECTOR, "button[aria-expanded='false'][data-automation-id*='panel']"),
+    )
+    _SECTION_UNION_CSS = ", ".join(sel for _by, sel in SECTION_TOGGLES)
+    LOGIN_USERNAME_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "input[data-automation-id='email']"),
+        (By.CSS_SELECTOR, "input[data-automation-id='userName']"),
+        (By.CSS_SELECTOR, "input[type='email']"),
+        (By.CSS_SELECTOR, "input[name='username']"),
+    )
+    LOGIN_PASSWORD_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "input[data-automation-id='password']"),
+        (By.CSS_SELECTOR, "input[type='password']"),
+        (By.CSS_SELECTOR, "input[name='password']"),
+    )
+    # Any of these on the page means Workday is asking us to authenticate.
+    LOGIN_FIELD_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "input[name='username']"),
+        (By.CSS_SELECTOR, "input[data-automation-id='email']"),
+        (By.CSS_SELECTOR, "input[type='email']"),
+        (By.CSS_SELECTOR, "input[name='password']"),
+        (By.CSS_SELECTOR, "input[type='password']"),
+    )
+    # Union form of the above: answers "is login needed?" in one query.
+    _LOGIN_UNION_CSS = ", ".join(sel for _by, sel in LOGIN_FIELD_SELECTORS)
+    LOGIN_SUBMIT_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "button[data-automation-id='signInSubmitButton']"),
+        (By.CSS_SELECTOR, "button[data-automation-id='signInButton']"),
+        (By.CSS_SELECTOR, "button[data-automation-id='click_filter']"),
+        (By.XPATH, "//button[contains(translate(., 'SIGN IN', 'sign in'), 'sign in')]"),
+    )
+    CREATE_LINK_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "a[data-automation-id='createAccountLink']"),
+        (By.CSS_SELECTOR, "button[data-automation-id='createAccountLink']"),
+        (By.XPATH,
+         "//a[contains(translate(., 'CREATE ACCOUNT', 'create account'), 'create account')"
+         " or contains(translate(., 'SIGN UP', 'sign up'), 'sign up')]"
+         " | //button[contains(translate(., 'CREATE ACCOUNT', 'create account'), 'create account')]"),
+    )
+    CREATE_VERIFY_PASSWORD_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "input[data-automation-id='verifyPassword']"),
+        (By.CSS_SELECTOR, "input[name='verifyPassword']"),
+    )
+    CREATE_SUBMIT_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "button[data-automation-id='createAccountSubmitButton']"),
+        (By.XPATH, "//button[contains(translate(., 'CREATE ACCOUNT', 'create account'), 'create account')]"),
+    )
+    TEXT_FIELD_MAP: dict[str, tuple[tuple[str, str], ...]] = {
+        "first_name": (
+            (By.CSS_SELECTOR, "input[data-automation-id='legalNameSection_firstName']"),
+            (By.CSS_SELECTOR, "input[data-automation-id*='firstName']"),
+            (By.CSS_SELECTOR, "input[name*='firstName']"),
+        ),
+        "last_name": (
+            (By.CSS_SELECTOR, "input[data-automation-id='legalNameSection_lastName']"),
+            (By.CSS_SELECTOR, "input[data-automation-id*='lastName']"),
+            (By.CSS_SELECTOR, "input[name*='lastName']"),
+        ),
+        "email": (
+            (By.CSS_SELECTOR, "input[data-automation-id='email']"),
+            (By.CSS_SELECTOR, "input[type='email']"),
+        ),
+        "phone": (
+            (By.CSS_SELECTOR, "input[data-automation-id='phone-number']"),
+            (By.CSS_SELECTOR, "input[data-automation-id*='phone']"),
+            (By.CSS_SELECTOR, "input[type='tel']"),
+        ),
+        "address_line": (
+            (By.CSS_SELECTOR, "input[data-automation-id='addressSection_addressLine1']"),
+            (By.CSS_SELECTOR, "input[name*='addressLine1']"),
+        ),
+        "city": (
+            (By.CSS_SELECTOR, "input[data-automation-id='addressSection_city']"),
+            (By.CSS_SELECTOR, "input[name*='city']"),
+        ),
+        "state": (
+            (By.CSS_SELECTOR, "input[data-automation-id='addressSection_countryRegion']"),
+            (By.CSS_SELECTOR, "input[name*='region']"),
+        ),
+        "postal_code": (
+            (By.CSS_SELECTOR, "input[data-automation-id='addressSection_postalCode']"),
+            (By.CSS_SELECTOR, "input[name*='postalCode']"),
+        ),
+        "country": (
+            (By.CSS_SELECTOR, "input[data-automation-id='countryDropdown']"),
+            (By.CSS_SELECTOR, "input[name*='country']"),
+        ),
+    }
+    # Comma-joined CSS selector lists, built once at class load: the browser
+    # checks every alternative in a single querySelector pass instead of one
+    # 2-second wait per variant.
+    TEXT_FIELD_UNIONS: dict[str, str] = {
+        key: ", ".join(sel for _by, sel in selectors)
+        for key, selectors in TEXT_FIELD_MAP.items()
+    }
+    _CONTACT_UNION_CSS = ", ".join(TEXT_FIELD_UNIONS.values())
+    UPLOAD_TRIGGER_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "button[data-automation-id='select-files']"),
+        (By.CSS_SELECTOR, "button[data-automation-id*='attach']"),
+    )
+    RESUME_UPLOAD_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "input[data-automation-id='file-upload-input-ref']"),
+        (By.CSS_SELECTOR, "input[type='file'][data-automation-id*='resume']"),
+        (By.CSS_SELECTOR, "input[type='file']"),
+    )
+    COVER_LETTER_UPLOAD_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "input[type='file'][data-automation-id*='cover']"),
+        (By.CSS_SELECTOR, "input[data-automation-id='file-upload-input-ref']"),
+    )
+    COVER_LETTER_TEXTAREAS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "textarea[data-automation-id*='cover']"),
+        (By.CSS_SELECTOR, "textarea[name*='cover']"),
+    )
+    UPLOAD_SUCCESS_SELECTORS: tuple[tuple[str, str], ...] = (
+        (By.CSS_SELECTOR, "[data-automation-id='fileUploadSuccess']"),
+        (By.CSS_SELECTOR, "[data-automation-id*='file-name']"),
+    )
+
+    # One in-browser pass over a list of CSS selectors costs a single WebDriver
+    # round-trip, versus one find_elements round-trip per selector.
+    _FIRST_MATCH_JS = """
+    for (const sel of arguments[0]) {
+        const el = document.querySelector(sel);
+        if (el) return el;
+    }
+    return null;
+    """
+    _FIRST_MATCHING_SELECTOR_JS = """
+    for (const sel of arguments[0]) {
+        if (document.querySelector(sel)) return sel;
+    }
+    return null;
+    """
+    # Sets every (selector, value) pair in one browser-side pass and reports
+    # which selectors were actually filled, so the caller can fall back to
+    # real keystrokes for the rest. Workday's UI is React: writing el.value
+    # directly also updates React's internal value tracker and the input
+    # event is then discarded as a no-change, so the value is set through
+    # the native prototype setter and verified before being reported.
+    _BULK_FILL_JS = """
+    const pairs = arguments[0];
+    const filled = [];
+    const setNative = (el, val) => {
+        const proto = el instanceof HTMLTextAreaElement
+            ? HTMLTextAreaElement.prototype
+            : HTMLInputElement.prototype;
+        const desc = Object.getOwnPropertyDescriptor(proto, 'value');
+        if (desc && desc.set) { desc.set.call(el, val); } else { el.value = val; }
+    };
+    for (const [sel, val] of pairs) {
+        const el = document.querySelector(sel);
+        if (!el) continue;
+        el.focus();
+        setNative(el, val);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        el.blur();
+        if (el.value === val) filled.push(sel);
+    }
+    return filled;
+    """
+    # Scrolling an already-visible element is a wasted layout pass; only
+    # scroll when the element sits outside the viewport.
+    _SCROLL_IF_NEEDED_JS = """
+    const r = arguments[0].getBoundingClientRect();
+    if (r.top < 0 || r.bottom > innerHeight) {
+        arguments[0].scrollIntoView({block: 'center'});
+    }
+    """
+    # One pass returns every section toggle with its expansion state, versus
+    # a get_attribute round-trip per button.
+    _SECTION_STATES_JS = """
+    return Array.from(document.querySelectorAll(arguments[0]))
+        .map(b => [b, b.getAttribute('aria-expanded') === 'true']);
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], WebDriver | None],
+        profile: CandidateProfile,
+        wait_seconds: int = 20,
+        verbose: bool = True,
+        login_username: str = "",
+        login_password: str = "",
+        allow_account_creation: bool = False,
+    ) -> None:
+        self._driver_factory = driver_factory
+        self.profile = profile
+        self.wait_seconds = wait_seconds
+        self.verbose = verbose
+        self._login_username = login_username.strip()
+        self._login_password = login_password.strip()
+        self.allow_account_creation = allow_account_creation
+        self._driver: WebDriver | None = None
+        self._owns_driver = True
+        # Locators that worked on a previous page of the same tenant.
+        self._known_selectors: dict[str, tuple[str, str]] = {}
+        # Runtime.evaluate only sees the top-level document, so the CDP
+        # wait path must be bypassed while inside the application iframe.
+        self._in_frame = False
+
+    @classmethod
+    def from_shared_driver(
+        cls,
+        driver: WebDriver,
+        profile: CandidateProfile,
+        **kwargs: Any,
+    ) -> "WorkdayAutofill":
+        """Wrap an already-open driver; close() leaves it running for the caller."""
+        instance = cls(lambda: driver, profile, **kwargs)
+        instance._driver = driver
+        instance._owns_driver = False
+        return instance
+
+    def __enter__(self) -> "WorkdayAutofill":
+        self._ensure_driver()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _ensure_driver(self) -> WebDriver | None:
+        if self._driver is None:
+            self._driver = _DRIVER_POOL.acquire(self._driver_factory)
+            if self._driver is not None:
+                with contextlib.suppress(WebDriverException):
+                    self._driver.implicitly_wait(0)
+        return self._driver
+
+    @property
+    def driver(self) -> WebDriver:
+        drv = self._ensure_driver()
+        if drv is None:
+            raise RuntimeError("Selenium driver could not be created")
+        return drv
+
+    def close(self) -> None:
+        if self._driver and self._owns_driver:
+            # Return the session to the pool so the next run skips browser
+            # startup; the pool quits broken sessions itself.
+            _DRIVER_POOL.release(self._driver)
+        self._driver = None
+
+    def _log(self, msg: str) -> None:
+        if self.verbose:
+            print(f"[autofill.workday] {msg}")
+
+    # -- waiting helpers ---------------------------------------------------
+
+    def _wait_for_page_ready(self, driver: WebDriver) -> None:
+        """Block until the document finishes loading (no fixed sleep)."""
+        with contextlib.suppress(TimeoutException, WebDriverException):
+            WebDriverWait(driver, self.wait_seconds).until(
+                lambda d: d.execute_script("return document.readyState") == "complete"
+            )
+
+    def _first_match(self, driver: WebDriver, selectors: Iterable[tuple[str, str]]):
+        """Return the first element matching any selector, CSS batch first."""
+        selectors = tuple(selectors)
+        css = [sel for by, sel in selectors if by == By.CSS_SELECTOR]
+        if css:
+            with contextlib.suppress(WebDriverException):
+                el = driver.execute_script(self._FIRST_MATCH_JS, css)
+                if el is not None:
+                    return el
+        for by, selector in selectors:
+            if by == By.CSS_SELECTOR:
+                continue
+            found = driver.find_elements(by, selector)
+            if found:
+                return found[0]
+        return None
+
+    def _wait_for_any(self, driver: WebDriver, selectors: Iterable[tuple[str, str]], timeout: float) -> bool:
+        # EC.any_of short-circuits inside one poll cycle; no Python-side
+        # closure rebuilding the selector scan on every poll.
+        try:
+            WebDriverWait(driver, timeout).until(
+                EC.any_of(*[EC.presence_of_element_located(s) for s in selectors])
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_for_any_cdp(self, driver: WebDriver, selectors: Iterable[tuple[str, str]], timeout: float) -> bool:
+        """Wait for any selector entirely inside the browser via CDP.
+
+        Runtime.evaluate with awaitPromise resolves on the animation frame
+        where a match appears, instead of WebDriverWait's 500 ms polling
+        granularity. Falls back to _wait_for_any for non-Chromium drivers,
+        for selector lists containing XPath entries, and after a
+        switch_to.frame — Runtime.evaluate runs in the top-level document
+        regardless of the WebDriver frame context, so polling it from
+        inside the application iframe would never match.
+        """
+        selectors = tuple(selectors)
+        if (
+            self._in_frame
+            or not hasattr(driver, "execute_cdp_cmd")
+            or any(by != By.CSS_SELECTOR for by, _sel in selectors)
+        ):
+            return self._wait_for_any(driver, selectors, timeout)
+        condition = " || ".join(
+            f"!!document.querySelector({json.dumps(sel)})" for _by, sel in selectors
+        )
+        expression = (
+            "new Promise(resolve => {"
+            f"const check = () => {{ if ({condition}) resolve(true); else requestAnimationFrame(check); }};"
+            "check();"
+            f"setTimeout(() => resolve(false), {int(timeout * 1000)});"
+            "})"
+        )
+        try:
+            result = driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": expression, "awaitPromise": True}
+            )
+            return bool(result.get("result", {}).get("value"))
+        except WebDriverException:
+            return self._wait_for_any(driver, selectors, timeout)
+
+    # -- login / account creation -----------------------------------------
+
+    def _first_present(self, driver: WebDriver, selectors: Iterable[tuple[str, str]], timeout: float = 5):
+        """One wait covering every selector; returns the first match or None.
+
+        A single EC.any_of poll cycle replaces a loop that built a fresh
+        WebDriverWait (and paid its full timeout on a miss) per selector.
+        """
+        try:
+            return WebDriverWait(driver, timeout).until(
+                EC.any_of(*[EC.presence_of_element_located(s) for s in selectors])
+            )
+        except TimeoutException:
+            return None
+
+    def _login_required(self, driver: WebDriver) -> bool:
+        with contextlib.suppress(WebDriverException):
+            return bool(
+                driver.execute_script(
+                    "return !!document.querySelector(arguments[0]);", self._LOGIN_UNION_CSS
+                )
+            )
+        return False
+
     def _perform_login(self, driver: WebDriver) -> bool:
         passwords = [self._login_password]
         # Add secondary password if available
-        import os
         secondary = os.getenv("WORKDAY_PASSWORD_SECONDARY")
         if secondary:
             passwords.append(secondary.strip())
-            
+
         for pwd in passwords:
             if not pwd:
                 continue
-                
+
             # Fill username
             user_set = False
-            for by, selector in self.LOGIN_USERNAME_SELECTORS:
-                try:
-                    el = WebDriverWait(driver, 5).until(EC.presence_of_element_located((by, selector)))
+            el = self._first_present(driver, self.LOGIN_USERNAME_SELECTORS)
+            if el is not None:
+                with contextlib.suppress(WebDriverException):
                     with contextlib.suppress(WebDriverException):
                         el.clear()
                     el.send_keys(self._login_username)
                     user_set = True
-                    break
-                except TimeoutException:
-                    continue
-                except WebDriverException:
-                    continue
-                    
+
             # Fill password
             pass_set = False
-            for by, selector in self.LOGIN_PASSWORD_SELECTORS:
-                try:
-                    el = WebDriverWait(driver, 5).until(EC.presence_of_element_located((by, selector)))
+            el = self._first_present(driver, self.LOGIN_PASSWORD_SELECTORS)
+            if el is not None:
+                with contextlib.suppress(WebDriverException):
                     with contextlib.suppress(WebDriverException):
                         el.clear()
                     el.send_keys(pwd)
                     pass_set = True
-                    break
-                except TimeoutException:
-                    continue
-                except WebDriverException:
-                    continue
-            
+
             # Submit
             submitted = False
             if user_set and pass_set:
@@ -52,17 +571,397 @@
                             break
                     if submitted:
                         break
-            
+
             if not submitted:
                 continue
-                
-            time.sleep(2.5)
+
             # Success condition: apply button or application iframe appears
+            # (_wait_for_any polls, so no fixed post-submit sleep is needed).
             if self._wait_for_any(driver, self.APPLY_BUTTON_SELECTORS + self.APPLICATION_IFRAME_SELECTORS, self.wait_seconds):
                 self._log("Login successful.")
                 return True
-            
+
             self._log("Login attempt failed (or not detected), trying next password if available...")
-            
+
         self._log("All login attempts failed.")
         return False
+
+    def _try_create_account(self, driver: WebDriver) -> bool:
+        clicked = False
+        for by, selector in self.CREATE_LINK_SELECTORS:
+            for el in driver.find_elements(by, selector):
+                with contextlib.suppress(WebDriverException):
+                    el.click()
+                    clicked = True
+                    break
+            if clicked:
+                break
+        if not clicked:
+            self._log("No create-account link found.")
+            return False
+        self._wait_for_any(driver, self.LOGIN_USERNAME_SELECTORS, 5)
+
+        # Fill email
+        email_set = False
+        el = self._first_present(driver, self.LOGIN_USERNAME_SELECTORS)
+        if el is not None:
+            with contextlib.suppress(WebDriverException):
+                with contextlib.suppress(WebDriverException):
+                    el.clear()
+                el.send_keys(self._login_username or self.profile.email)
+                email_set = True
+
+        # Fill password + verification
+        pass_set = False
+        el = self._first_present(driver, self.LOGIN_PASSWORD_SELECTORS)
+        if el is not None:
+            with contextlib.suppress(WebDriverException):
+                with contextlib.suppress(WebDriverException):
+                    el.clear()
+                el.send_keys(self._login_password)
+                pass_set = True
+        for by, selector in self.CREATE_VERIFY_PASSWORD_SELECTORS:
+            for el in driver.find_elements(by, selector):
+                with contextlib.suppress(WebDriverException):
+                    el.clear()
+                    el.send_keys(self._login_password)
+                break
+
+        if not (email_set and pass_set):
+            self._log("Could not fill account-creation form.")
+            return False
+
+        submitted = False
+        for by, selector in self.CREATE_SUBMIT_SELECTORS:
+            for b in driver.find_elements(by, selector):
+                with contextlib.suppress(WebDriverException):
+                    b.click()
+                    submitted = True
+                    break
+            if submitted:
+                break
+        if not submitted:
+            return False
+
+        if self._wait_for_any(driver, self.APPLY_BUTTON_SELECTORS + self.APPLICATION_IFRAME_SELECTORS, self.wait_seconds):
+            self._log("Account created.")
+            return True
+        self._log("Account creation not confirmed.")
+        return False
+
+    # -- application form --------------------------------------------------
+
+    def _click_apply_button(self, driver: WebDriver) -> bool:
+        el = self._first_match(driver, self.APPLY_BUTTON_SELECTORS)
+        if el is None:
+            return False
+        with contextlib.suppress(WebDriverException):
+            el.click()
+            # Wait for the form (or the login wall) to show up rather
+            # than sleeping a fixed interval after the click.
+            self._wait_for_any_cdp(
+                driver,
+                self.APPLICATION_IFRAME_SELECTORS
+                + self.SECTION_TOGGLES
+                + self.LOGIN_FIELD_SELECTORS,
+                self.wait_seconds,
+            )
+            return True
+        return False
+
+    def _enter_application_context(self, driver: WebDriver) -> None:
+        """Switch into the application iframe when Workday renders one."""
+        driver.switch_to.default_content()
+        self._in_frame = False
+        frame = self._first_match(driver, self.APPLICATION_IFRAME_SELECTORS)
+        if frame is not None:
+            with contextlib.suppress(WebDriverException):
+                driver.switch_to.frame(frame)
+                self._in_frame = True
+                self._log("Switched into application iframe.")
+
+    def _expand_sections(self, driver: WebDriver) -> None:
+        try:
+            states = driver.execute_script(self._SECTION_STATES_JS, self._SECTION_UNION_CSS)
+        except WebDriverException:
+            return
+        for button, expanded in states:
+            if expanded:
+                continue
+            try:
+                button.click()
+                with contextlib.suppress(TimeoutException):
+                    WebDriverWait(driver, 2).until(
+                        lambda _d: button.get_attribute("aria-expanded") == "true"
+                    )
+            except StaleElementReferenceException:
+                continue
+            except WebDriverException:
+                continue
+
+    def _retry_stale(
+        self,
+        action: Callable[[Any], None],
+        driver: WebDriver,
+        by: str,
+        selector: str,
+        retries: int = 3,
+    ) -> bool:
+        """Run action(element), re-finding the same locator when it goes stale.
+
+        Re-resolving the one locator that just matched is cheaper than
+        falling through to the rest of a selector list, and avoids false
+        negatives when Workday re-renders a section mid-interaction.
+        """
+        for _attempt in range(retries):
+            els = driver.find_elements(by, selector)
+            if not els:
+                return False
+            try:
+                action(els[0])
+                return True
+            except StaleElementReferenceException:
+                continue
+            except WebDriverException:
+                return False
+        return False
+
+    def _fill_text_field(self, driver: WebDriver, key: str, value: str) -> bool:
+        # _fill_contact_information has already waited for the form, so a
+        # non-blocking probe suffices; absent fields cost one round-trip
+        # instead of a 2-second timeout.
+        known = self._known_selectors.get(key)
+        if known is not None:
+            by, selector = known
+        else:
+            by, selector = By.CSS_SELECTOR, self.TEXT_FIELD_UNIONS[key]
+            # Ask the browser which alternative actually hits so later pages
+            # of the same tenant can target it directly.
+            with contextlib.suppress(WebDriverException):
+                matched = driver.execute_script(
+                    self._FIRST_MATCHING_SELECTOR_JS,
+                    [sel for _by, sel in self.TEXT_FIELD_MAP[key]],
+                )
+                if matched:
+                    selector = matched
+
+        def type_into(element: Any) -> None:
+            driver.execute_script(self._SCROLL_IF_NEEDED_JS, element)
+            element.click()
+            element.clear()
+            element.send_keys(value)
+            element.send_keys(Keys.TAB)
+
+        if self._retry_stale(type_into, driver, by, selector):
+            self._known_selectors[key] = (by, selector)
+            return True
+        if known is not None:
+            # The cached locator missed on this page; retry with the union.
+            del self._known_selectors[key]
+            return self._fill_text_field(driver, key, value)
+        return False
+
+    def _contact_items(self) -> tuple[tuple[str, str], ...]:
+        """Populated (field, value) pairs, tolerating foreign profile types.
+
+        apply_greenhouse.py hands this class the portal_autofill
+        CandidateProfile, which has no cached contact views; fall back to
+        reading the known field names off the object directly.
+        """
+        items = getattr(self.profile, "_non_empty_items", None)
+        if items is not None:
+            return items
+        pairs = []
+        for key in self.TEXT_FIELD_MAP:
+            value = str(getattr(self.profile, key, "") or "").strip()
+            if value:
+                pairs.append((key, value))
+        return tuple(pairs)
+
+    def _fill_contact_information(self, driver: WebDriver) -> int:
+        # One upfront wait for any contact field to render covers the whole
+        # form; the per-field probes below are then non-blocking.
+        self._wait_for_any_cdp(driver, ((By.CSS_SELECTOR, self._CONTACT_UNION_CSS),), self.wait_seconds)
+        # The profile precomputes its populated fields; resolve each union
+        # once here instead of a dict lookup and emptiness branch per field.
+        pending = [
+            (key, self.TEXT_FIELD_UNIONS[key], value)
+            for key, value in self._contact_items()
+            if key in self.TEXT_FIELD_UNIONS
+        ]
+        # One execute_script fills the whole form in a single round-trip
+        # instead of ~5 WebDriver calls per field.
+        filled_selectors: set[str] = set()
+        if pending:
+            with contextlib.suppress(WebDriverException):
+                filled_selectors = set(
+                    driver.execute_script(
+                        self._BULK_FILL_JS,
+                        [[union, value] for _key, union, value in pending],
+                    )
+                )
+        filled = 0
+        for key, union, value in pending:
+            if union in filled_selectors:
+                filled += 1
+                continue
+            # Inputs the JS pass could not reach get real keystrokes.
+            if self._fill_text_field(driver, key, value):
+                filled += 1
+        return filled
+
+    # -- uploads -----------------------------------------------------------
+
+    def _trigger_upload(self, driver: WebDriver) -> None:
+        """Click buttons that reveal hidden file inputs."""
+        button = self._first_match(driver, self.UPLOAD_TRIGGER_SELECTORS)
+        if button is not None:
+            with contextlib.suppress(WebDriverException):
+                button.click()
+                # Wait for the revealed input instead of sleeping.
+                self._wait_for_any_cdp(driver, self.RESUME_UPLOAD_SELECTORS, 3)
+
+    def _upload_via_cdp(self, driver: WebDriver, selector: str, path: Path) -> bool:
+        """Attach a file through DOM.setFileInputFiles.
+
+        The CDP call returns once the browser has queued the file, so the
+        caller can wait on Workday's upload indicator instead of guessing
+        how long send_keys plus the synchronous file read will take.
+        Returns False on non-Chromium drivers, when the input is absent, or
+        inside the application iframe (the CDP DOM agent resolves selectors
+        against the top-level document only).
+        """
+        if self._in_frame or not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            doc = driver.execute_cdp_cmd("DOM.getDocument", {})
+            node = driver.execute_cdp_cmd(
+                "DOM.querySelector",
+                {"nodeId": doc["root"]["nodeId"], "selector": selector},
+            )
+            if not node.get("nodeId"):
+                return False
+            driver.execute_cdp_cmd(
+                "DOM.setFileInputFiles",
+                {"files": [str(path)], "nodeId": node["nodeId"]},
+            )
+            return True
+        except (WebDriverException, KeyError):
+            return False
+
+    def _upload_generic(self, driver: WebDriver, selectors: Iterable[tuple[str, str]], path: Path, label: str) -> bool:
+        for by, selector in selectors:
+            if by == By.CSS_SELECTOR and self._upload_via_cdp(driver, selector, path):
+                pass
+            elif not self._retry_stale(lambda el: el.send_keys(str(path)), driver, by, selector):
+                continue
+            # Wait for Workday's upload indicator rather than a blind sleep.
+            self._wait_for_any_cdp(driver, self.UPLOAD_SUCCESS_SELECTORS, self.wait_seconds)
+            self._log(f"Uploaded {label}: {path.name}")
+            return True
+        self._log(f"No upload input found for {label}.")
+        return False
+
+    def _handle_resume(self, driver: WebDriver, path: Path) -> bool:
+        if not _file_exists(str(path)):
+            self._log(f"Resume file not found: {path}")
+            return False
+        self._trigger_upload(driver)
+        return self._upload_generic(driver, self.RESUME_UPLOAD_SELECTORS, path, "resume")
+
+    def _handle_cover_letter(self, driver: WebDriver, path: Path) -> bool:
+        if not _file_exists(str(path)):
+            self._log(f"Cover letter file not found: {path}")
+            return False
+        if path.suffix.lower() == ".txt":
+            text = _read_text_cached(str(path))
+            for by, selector in self.COVER_LETTER_TEXTAREAS:
+                for area in driver.find_elements(by, selector):
+                    with contextlib.suppress(WebDriverException):
+                        area.clear()
+                        area.send_keys(text)
+                        self._log("Pasted cover letter text.")
+                        return True
+        return self._upload_generic(driver, self.COVER_LETTER_UPLOAD_SELECTORS, path, "cover letter")
+
+    # -- entry point -------------------------------------------------------
+
+    def fill_application(self, job_url: str, resume_path: str | None = None, cover_letter_path: str | None = None) -> bool:
+        driver = self.driver
+        self._log(f"Opening {job_url}")
+        driver.get(job_url)
+        self._wait_for_page_ready(driver)
+
+        self._click_apply_button(driver)
+
+        if self._login_required(driver):
+            handled = False
+            if self._login_username and self._login_password:
+                handled = self._perform_login(driver)
+            if not handled and self.allow_account_creation:
+                handled = self._try_create_account(driver)
+            if not handled:
+                raise RuntimeError("Workday requires login and authentication failed")
+            self._click_apply_button(driver)
+
+        self._enter_application_context(driver)
+        self._expand_sections(driver)
+        filled = self._fill_contact_information(driver)
+        self._log(f"Filled {filled} contact fields.")
+
+        if resume_path:
+            self._handle_resume(driver, Path(resume_path).expanduser())
+        if cover_letter_path:
+            self._handle_cover_letter(driver, Path(cover_letter_path).expanduser())
+
+        self._log("Finished Workday autofill (application NOT submitted).")
+        # Leave the session ready for the next URL instead of quitting it.
+        with contextlib.suppress(WebDriverException):
+            driver.switch_to.default_content()
+            self._in_frame = False
+            driver.get("about:blank")
+        return True
+
+    def fill_many(
+        self,
+        urls: Iterable[str],
+        max_workers: int = 4,
+        resume_path: str | None = None,
+        cover_letter_path: str | None = None,
+    ) -> dict[str, bool | str]:
+        """Fill several applications concurrently, one browser per worker.
+
+        Selenium calls release the GIL while waiting on the wire protocol,
+        so a thread pool gives near-linear throughput. To spread sessions
+        across a Selenium Grid, have ``driver_factory`` return
+        ``webdriver.Remote(command_executor=grid_url, options=chrome_opts)``.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        def run(url: str) -> bool:
+            worker = WorkdayAutofill(
+                self._driver_factory,
+                self.profile,
+                wait_seconds=self.wait_seconds,
+                verbose=self.verbose,
+                login_username=self._login_username,
+                login_password=self._login_password,
+                allow_account_creation=self.allow_account_creation,
+            )
+            try:
+                return worker.fill_application(
+                    url, resume_path=resume_path, cover_letter_path=cover_letter_path
+                )
+            finally:
+                worker.close()
+
+        results: dict[str, bool | str] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(run, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    results[url] = f"Error: {str(e)}"
+        return results